@@ -1,27 +1,34 @@
 import argparse
+import atexit
 
 # import asyncio
 import base64
+import hashlib
+import io
 import json
+import logging
 import multiprocessing
 import os
-import traceback
-
-# import sys
+import queue
+import sys
+import threading
 import zipfile
-from distutils.version import LooseVersion
-from functools import lru_cache
+from collections import OrderedDict
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from tempfile import NamedTemporaryFile, TemporaryFile
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
-import soundfile
+import anyio
+import orjson
 import uvicorn
-from fastapi import FastAPI, File, Form, HTTPException, Request, Response, UploadFile
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.params import Query
-from pydantic import ValidationError, conint
-from starlette.responses import FileResponse
+from packaging.version import Version
+from pydantic import BaseModel, ValidationError, conint
+from pydantic.error_wrappers import ErrorWrapper
 
 from voicevox_engine import __version__
 from voicevox_engine.cancellable_engine import CancellableEngine
@@ -29,6 +36,8 @@ from voicevox_engine.kana_parser import create_kana, parse_kana
 from voicevox_engine.model import (
     AccentPhrase,
     AudioQuery,
+    GuidedAccentPhraseForm,
+    GuidedSynthesisForm,
     ParseKanaBadRequest,
     ParseKanaError,
     Speaker,
@@ -37,7 +46,7 @@ from voicevox_engine.model import (
     UserDictWord,
     WordTypes,
 )
-from voicevox_engine.morphing import synthesis_morphing
+from voicevox_engine.morphing import MorphingParameter, synthesis_morphing
 from voicevox_engine.morphing import (
     synthesis_morphing_parameter as _synthesis_morphing_parameter,
 )
@@ -50,21 +59,77 @@ from voicevox_engine.user_dict import (
     import_user_dict,
     read_dict,
     rewrite_word,
+    sync_user_dict,
     user_dict_startup_processing,
+    user_dict_state,
 )
 from voicevox_engine.utility import (
     ConnectBase64WavesException,
+    MultipartFormSizeException,
+    NumpyORJSONResponse,
     connect_base64_waves,
     engine_root,
+    read_multipart_form,
+    wave_to_bytes,
+    write_wave,
 )
 
+# 例外のログ出力でリクエストの処理が止まらないよう、標準エラー出力への書き込みは別スレッドで行う
+logger = logging.getLogger("voicevox_engine")
+logger.propagate = False
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stderr))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 
 def b64encode_str(s):
     return base64.b64encode(s).decode("utf-8")
 
 
+FormModel = TypeVar("FormModel", bound=BaseModel)
+
+# フォームの値はメモリ上に保持するため、ガイドとなる音声ファイルなどの大きさを制限する
+MAX_FORM_FIELD_SIZE = 50 * 1024 * 1024
+
+
+async def read_form(request: Request, form_model: Type[FormModel]) -> FormModel:
+    """
+    multipart/form-dataのリクエストボディを解析し、フォームのモデルとして検証する
+    検証に失敗した場合は、Form(...)を使った場合と同じ形式の422エラーにする
+    値がMAX_FORM_FIELD_SIZEを超えるフィールドがある場合は413エラーにする
+    """
+    try:
+        form = await read_multipart_form(
+            request, form_model.__fields__, max_size=MAX_FORM_FIELD_SIZE
+        )
+    except MultipartFormSizeException as e:
+        raise HTTPException(status_code=413, detail=e.message)
+    try:
+        return form_model(**form)
+    except ValidationError as e:
+        raise RequestValidationError([ErrorWrapper(e, loc="body")])
+
+
+def multipart_form_openapi(form_model: Type[BaseModel]) -> dict:
+    """
+    read_formで読み込むフォームを、OpenAPIのリクエストボディとして記述する
+    """
+    return {
+        "requestBody": {
+            "content": {"multipart/form-data": {"schema": form_model.schema()}},
+            "required": True,
+        }
+    }
+
+
 def generate_app(
-    synthesis_engines: Dict[str, SynthesisEngineBase], latest_core_version: str
+    synthesis_engines: Dict[str, SynthesisEngineBase],
+    latest_core_version: str,
+    cpu_num_threads: Optional[int] = None,
+    enable_guided_synthesis: bool = False,
+    cancellable_engine: Optional[CancellableEngine] = None,
 ) -> FastAPI:
     root_dir = engine_root()
 
@@ -74,6 +139,7 @@ def generate_app(
         title="VOICEVOX ENGINE",
         description="VOICEVOXの音声合成エンジンです。",
         version=__version__,
+        default_response_class=NumpyORJSONResponse,
     )
 
     app.add_middleware(
@@ -84,6 +150,18 @@ def generate_app(
         allow_headers=["*"],
     )
 
+    # 話者情報は起動中に変化しないため、エンジンごとに一度だけ変換しておく
+    speakers_bytes: Dict[str, bytes] = {
+        core_version: engine.speakers.encode("utf-8")
+        for core_version, engine in synthesis_engines.items()
+    }
+    speakers_by_uuid: Dict[str, Dict[str, dict]] = {
+        core_version: {
+            speaker["speaker_uuid"]: speaker for speaker in json.loads(engine.speakers)
+        }
+        for core_version, engine in synthesis_engines.items()
+    }
+
     preset_loader = PresetLoader(
         preset_path=root_dir / "presets.yaml",
     )
@@ -91,11 +169,47 @@ def generate_app(
     # キャッシュを有効化
     # モジュール側でlru_cacheを指定するとキャッシュを制御しにくいため、HTTPサーバ側で指定する
     # TODO: キャッシュを管理するモジュール側API・HTTP側APIを用意する
-    synthesis_morphing_parameter = lru_cache(maxsize=4)(_synthesis_morphing_parameter)
+    # パラメータは音声の長さに比例して大きくなるため、件数は少なめにする
+    # クエリ全体のハッシュ計算や比較を避けるため、合成結果に影響する値のダイジェストをキーにする
+    morphing_parameter_cache_size = 4
+    morphing_parameter_cache: "OrderedDict[tuple, MorphingParameter]" = OrderedDict()
+    morphing_parameter_cache_lock = threading.Lock()
+
+    def synthesis_morphing_parameter(
+        engine: SynthesisEngineBase,
+        query: AudioQuery,
+        base_speaker: int,
+        target_speaker: int,
+    ) -> MorphingParameter:
+        # outputStereoはパラメータ生成時にFalseに置き換えられ、kanaは合成に使われない
+        query_digest = hashlib.blake2b(
+            query.json(exclude={"outputStereo", "kana"}).encode("utf-8"),
+            digest_size=16,
+        ).digest()
+        key = (id(engine), base_speaker, target_speaker, query_digest)
+
+        with morphing_parameter_cache_lock:
+            morph_param = morphing_parameter_cache.get(key)
+            if morph_param is not None:
+                morphing_parameter_cache.move_to_end(key)
+                return morph_param
+
+        morph_param = _synthesis_morphing_parameter(
+            engine=engine,
+            query=query,
+            base_speaker=base_speaker,
+            target_speaker=target_speaker,
+        )
+
+        with morphing_parameter_cache_lock:
+            morphing_parameter_cache[key] = morph_param
+            if len(morphing_parameter_cache) > morphing_parameter_cache_size:
+                morphing_parameter_cache.popitem(last=False)
+        return morph_param
 
     # @app.on_event("startup")
     # async def start_catch_disconnection():
-    #     if args.enable_cancellable_synthesis:
+    #     if cancellable_engine is not None:
     #         loop = asyncio.get_event_loop()
     #         _ = loop.create_task(cancellable_engine.catch_disconnection())
 
@@ -103,12 +217,106 @@ def generate_app(
     def apply_user_dict():
         user_dict_startup_processing()
 
+    # 推論などの重い処理は、CPUスレッド数に合わせた専用のCapacityLimiterでスレッド数を制限する
+    # anyioの既定のCapacityLimiterは同期関数のエンドポイントの実行にも使われるため、変更しない
+    inference_limiter: Optional[anyio.CapacityLimiter] = None
+
+    @app.on_event("startup")
+    async def create_inference_limiter():
+        # CapacityLimiterはイベントループの中で作る必要がある
+        nonlocal inference_limiter
+        if cpu_num_threads:
+            inference_limiter = anyio.CapacityLimiter(cpu_num_threads)
+
+    async def run_inference(func: Callable[[], Any]) -> Any:
+        """
+        推論などの重い処理をスレッドで実行する
+        cpu_num_threadsの指定がない場合は、anyioの既定のCapacityLimiterを使う
+        """
+        return await anyio.to_thread.run_sync(func, limiter=inference_limiter)
+
+    # エンジンの構成は起動後に変わらないため、バージョンの指定がない場合も含めて対応表を作っておく
+    engine_resolver: Dict[Optional[str], SynthesisEngineBase] = dict(synthesis_engines)
+    engine_resolver[None] = synthesis_engines[latest_core_version]
+    core_version_resolver: Dict[Optional[str], str] = {
+        core_version: core_version for core_version in synthesis_engines
+    }
+    core_version_resolver[None] = latest_core_version
+
     def get_engine(core_version: Optional[str]) -> SynthesisEngineBase:
-        if core_version is None:
-            return synthesis_engines[latest_core_version]
-        if core_version in synthesis_engines:
-            return synthesis_engines[core_version]
-        raise HTTPException(status_code=422, detail="不明なバージョンです")
+        engine = engine_resolver.get(core_version)
+        if engine is None:
+            raise HTTPException(status_code=422, detail="不明なバージョンです")
+        return engine
+
+    def get_core_version(core_version: Optional[str]) -> str:
+        resolved_core_version = core_version_resolver.get(core_version)
+        if resolved_core_version is None:
+            raise HTTPException(status_code=422, detail="不明なバージョンです")
+        return resolved_core_version
+
+    async def submit_accent_phrases(
+        text: str, speaker_id: int, core_version: Optional[str]
+    ) -> List[AccentPhrase]:
+        engine = get_engine(core_version)
+
+        # 解析の前に、他のワーカープロセスで更新されたユーザー辞書を読み込み直す
+        def _create_accent_phrases() -> List[AccentPhrase]:
+            sync_user_dict()
+            return engine.create_accent_phrases(text, speaker_id=speaker_id)
+
+        return await run_inference(_create_accent_phrases)
+
+    # 同じテキスト・話者のクエリは繰り返し作成されやすいため、アクセント句と読み仮名をキャッシュする
+    # ユーザー辞書が更新されると結果が変わるため、キーには辞書の状態も含める
+    # 辞書の状態はファイルから得るため、他のワーカープロセスでの更新にも追従できる
+    accent_phrases_cache_size = 1024
+    accent_phrases_cache: "OrderedDict[tuple, Tuple[List[dict], str]]" = OrderedDict()
+
+    async def get_accent_phrases_and_kana(
+        text: str, speaker_id: int, core_version: Optional[str]
+    ) -> Tuple[List[dict], str]:
+        """
+        テキストからアクセント句と読み仮名を得る
+        アクセント句はレスポンスにそのまま使えるよう、辞書に変換したものを返す
+        返り値はキャッシュと共有されるため、呼び出し側で書き換えないこと
+        """
+        core_version = get_core_version(core_version)
+        # 解析の前に状態を得ておくことで、解析に使われる辞書はキーの状態と同じかより新しくなる
+        key = (text, speaker_id, core_version, user_dict_state())
+        cached = accent_phrases_cache.get(key)
+        if cached is not None:
+            accent_phrases_cache.move_to_end(key)
+            return cached
+
+        accent_phrases = await submit_accent_phrases(
+            text, speaker_id=speaker_id, core_version=core_version
+        )
+        cached = (
+            [accent_phrase.dict() for accent_phrase in accent_phrases],
+            create_kana(accent_phrases),
+        )
+
+        accent_phrases_cache[key] = cached
+        if len(accent_phrases_cache) > accent_phrases_cache_size:
+            accent_phrases_cache.popitem(last=False)
+        return cached
+
+    async def submit_synthesis(
+        query: AudioQuery,
+        speaker_id: int,
+        enable_interrogative_upspeak: bool,
+        core_version: Optional[str],
+    ):
+        engine = get_engine(core_version)
+        return await run_inference(
+            partial(
+                engine.synthesis,
+                query=query,
+                speaker_id=speaker_id,
+                enable_interrogative_upspeak=enable_interrogative_upspeak,
+            )
+        )
 
     @app.post(
         "/audio_query",
@@ -116,23 +324,27 @@ def generate_app(
         tags=["クエリ作成"],
         summary="音声合成用のクエリを作成する",
     )
-    def audio_query(text: str, speaker: int, core_version: Optional[str] = None):
+    async def audio_query(text: str, speaker: int, core_version: Optional[str] = None):
         """
         クエリの初期値を得ます。ここで得られたクエリはそのまま音声合成に利用できます。各値の意味は`Schemas`を参照してください。
         """
-        engine = get_engine(core_version)
-        accent_phrases = engine.create_accent_phrases(text, speaker_id=speaker)
-        return AudioQuery(
-            accent_phrases=accent_phrases,
-            speedScale=1,
-            pitchScale=0,
-            intonationScale=1,
-            volumeScale=1,
-            prePhonemeLength=0.1,
-            postPhonemeLength=0.1,
-            outputSamplingRate=default_sampling_rate,
-            outputStereo=False,
-            kana=create_kana(accent_phrases),
+        accent_phrases, kana = await get_accent_phrases_and_kana(
+            text, speaker_id=speaker, core_version=core_version
+        )
+        # 検証済みのアクセント句からAudioQueryを作り直さず、そのままレスポンスにする
+        return NumpyORJSONResponse(
+            {
+                "accent_phrases": accent_phrases,
+                "speedScale": 1.0,
+                "pitchScale": 0.0,
+                "intonationScale": 1.0,
+                "volumeScale": 1.0,
+                "prePhonemeLength": 0.1,
+                "postPhonemeLength": 0.1,
+                "outputSamplingRate": default_sampling_rate,
+                "outputStereo": False,
+                "kana": kana,
+            }
         )
 
     @app.post(
@@ -141,37 +353,36 @@ def generate_app(
         tags=["クエリ作成"],
         summary="音声合成用のクエリをプリセットを用いて作成する",
     )
-    def audio_query_from_preset(
+    async def audio_query_from_preset(
         text: str, preset_id: int, core_version: Optional[str] = None
     ):
         """
         クエリの初期値を得ます。ここで得られたクエリはそのまま音声合成に利用できます。各値の意味は`Schemas`を参照してください。
         """
-        engine = get_engine(core_version)
-        presets, err_detail = preset_loader.load_presets()
+        get_engine(core_version)
+        _, err_detail = preset_loader.load_presets()
         if err_detail:
             raise HTTPException(status_code=422, detail=err_detail)
-        for preset in presets:
-            if preset.id == preset_id:
-                selected_preset = preset
-                break
-        else:
+        selected_preset = preset_loader.presets_by_id.get(preset_id)
+        if selected_preset is None:
             raise HTTPException(status_code=422, detail="該当するプリセットIDが見つかりません")
 
-        accent_phrases = engine.create_accent_phrases(
-            text, speaker_id=selected_preset.style_id
+        accent_phrases, kana = await get_accent_phrases_and_kana(
+            text, speaker_id=selected_preset.style_id, core_version=core_version
         )
-        return AudioQuery(
-            accent_phrases=accent_phrases,
-            speedScale=selected_preset.speedScale,
-            pitchScale=selected_preset.pitchScale,
-            intonationScale=selected_preset.intonationScale,
-            volumeScale=selected_preset.volumeScale,
-            prePhonemeLength=selected_preset.prePhonemeLength,
-            postPhonemeLength=selected_preset.postPhonemeLength,
-            outputSamplingRate=default_sampling_rate,
-            outputStereo=False,
-            kana=create_kana(accent_phrases),
+        return NumpyORJSONResponse(
+            {
+                "accent_phrases": accent_phrases,
+                "speedScale": selected_preset.speedScale,
+                "pitchScale": selected_preset.pitchScale,
+                "intonationScale": selected_preset.intonationScale,
+                "volumeScale": selected_preset.volumeScale,
+                "prePhonemeLength": selected_preset.prePhonemeLength,
+                "postPhonemeLength": selected_preset.postPhonemeLength,
+                "outputSamplingRate": default_sampling_rate,
+                "outputStereo": False,
+                "kana": kana,
+            }
         )
 
     @app.post(
@@ -186,7 +397,7 @@ def generate_app(
             }
         },
     )
-    def accent_phrases(
+    async def accent_phrases(
         text: str,
         speaker: int,
         is_kana: bool = False,
@@ -210,26 +421,30 @@ def generate_app(
                     status_code=400,
                     detail=ParseKanaBadRequest(err).dict(),
                 )
-            accent_phrases = engine.replace_mora_data(
-                accent_phrases=accent_phrases, speaker_id=speaker
+            accent_phrases = await run_inference(
+                partial(
+                    engine.replace_mora_data,
+                    accent_phrases=accent_phrases,
+                    speaker_id=speaker,
+                )
             )
 
             return accent_phrases
         else:
-            return engine.create_accent_phrases(text, speaker_id=speaker)
+            accent_phrases, _ = await get_accent_phrases_and_kana(
+                text, speaker_id=speaker, core_version=core_version
+            )
+            return NumpyORJSONResponse(accent_phrases)
 
     @app.post(
         "/guided_accent_phrase",
         response_model=List[AccentPhrase],
         tags=["クエリ編集"],
         summary="Create Accent Phrase from External Audio",
+        openapi_extra=multipart_form_openapi(GuidedAccentPhraseForm),
     )
-    def guided_accent_phrase(
-        text: str = Form(...),  # noqa:B008
-        speaker: int = Form(...),  # noqa:B008
-        is_kana: bool = Form(...),  # noqa:B008
-        audio_file: UploadFile = File(...),  # noqa: B008
-        normalize: bool = Form(...),  # noqa:B008
+    async def guided_accent_phrase(
+        request: Request,
         core_version: Optional[str] = None,
     ):
         """
@@ -237,32 +452,36 @@ def generate_app(
         Returns a list of AccentPhrase.
         **This API works in the resolution of phonemes.**
         """
-        if not args.enable_guided_synthesis:
+        if not enable_guided_synthesis:
             raise HTTPException(
                 status_code=404,
                 detail="実験的機能はデフォルトで無効になっています。使用するには引数を指定してください。",
             )
         engine = get_engine(core_version)
-        if is_kana:
+        form = await read_form(request, GuidedAccentPhraseForm)
+        if form.is_kana:
             try:
-                accent_phrases = parse_kana(text)
+                accent_phrases = parse_kana(form.text)
             except ParseKanaError as err:
                 raise HTTPException(
                     status_code=400,
                     detail=ParseKanaBadRequest(err).dict(),
                 )
         else:
-            accent_phrases = engine.create_accent_phrases(
-                text,
-                speaker_id=speaker,
+            accent_phrases = await submit_accent_phrases(
+                form.text, speaker_id=form.speaker, core_version=core_version
             )
 
+        # アップロードされた音声の解析はスレッドで行う
         try:
-            return engine.guided_accent_phrases(
-                accent_phrases=accent_phrases,
-                speaker=speaker,
-                audio_file=audio_file.file,
-                normalize=normalize,
+            return await run_inference(
+                partial(
+                    engine.guided_accent_phrases,
+                    accent_phrases=accent_phrases,
+                    speaker=form.speaker,
+                    audio_file=io.BytesIO(form.audio_file),
+                    normalize=form.normalize,
+                )
             )
         except ParseKanaError as err:
             raise HTTPException(
@@ -270,13 +489,13 @@ def generate_app(
                 detail=ParseKanaBadRequest(err).dict(),
             )
         except StopIteration:
-            print(traceback.format_exc())
+            logger.exception("Failed in Forced Alignment")
             raise HTTPException(
                 status_code=500,
                 detail="Failed in Forced Alignment",
             )
         except Exception as e:
-            print(traceback.format_exc())
+            logger.exception("Failed in guided synthesis")
             if str(e) == "Decode Failed":
                 raise HTTPException(
                     status_code=500,
@@ -336,7 +555,7 @@ def generate_app(
 
     @app.post(
         "/synthesis",
-        response_class=FileResponse,
+        response_class=Response,
         responses={
             200: {
                 "content": {
@@ -347,7 +566,7 @@ def generate_app(
         tags=["音声合成"],
         summary="音声合成する",
     )
-    def synthesis(
+    async def synthesis(
         query: AudioQuery,
         speaker: int,
         enable_interrogative_upspeak: bool = Query(  # noqa: B008
@@ -356,23 +575,22 @@ def generate_app(
         ),
         core_version: Optional[str] = None,
     ):
-        engine = get_engine(core_version)
-        wave = engine.synthesis(
-            query=query,
+        wave = await submit_synthesis(
+            query,
             speaker_id=speaker,
             enable_interrogative_upspeak=enable_interrogative_upspeak,
+            core_version=core_version,
         )
 
-        with NamedTemporaryFile(delete=False) as f:
-            soundfile.write(
-                file=f, data=wave, samplerate=query.outputSamplingRate, format="WAV"
-            )
+        wav_bytes = await anyio.to_thread.run_sync(
+            wave_to_bytes, wave, query.outputSamplingRate
+        )
 
-        return FileResponse(f.name, media_type="audio/wav")
+        return Response(content=wav_bytes, media_type="audio/wav")
 
     @app.post(
         "/cancellable_synthesis",
-        response_class=FileResponse,
+        response_class=Response,
         responses={
             200: {
                 "content": {
@@ -389,25 +607,25 @@ def generate_app(
         request: Request,
         core_version: Optional[str] = None,
     ):
-        if not args.enable_cancellable_synthesis:
+        if cancellable_engine is None:
             raise HTTPException(
                 status_code=404,
                 detail="実験的機能はデフォルトで無効になっています。使用するには引数を指定してください。",
             )
-        f_name = cancellable_engine._synthesis_impl(
+        wav_bytes = cancellable_engine._synthesis_impl(
             query=query,
             speaker_id=speaker,
             request=request,
             core_version=core_version,
         )
-        if f_name == "":
+        if len(wav_bytes) == 0:
             raise HTTPException(status_code=422, detail="不明なバージョンです")
 
-        return FileResponse(f_name, media_type="audio/wav")
+        return Response(content=wav_bytes, media_type="audio/wav")
 
     @app.post(
         "/multi_synthesis",
-        response_class=FileResponse,
+        response_class=Response,
         responses={
             200: {
                 "content": {
@@ -420,7 +638,7 @@ def generate_app(
         tags=["音声合成"],
         summary="複数まとめて音声合成する",
     )
-    def multi_synthesis(
+    async def multi_synthesis(
         queries: List[AudioQuery],
         speaker: int,
         core_version: Optional[str] = None,
@@ -428,34 +646,41 @@ def generate_app(
         engine = get_engine(core_version)
         sampling_rate = queries[0].outputSamplingRate
 
-        with NamedTemporaryFile(delete=False) as f:
+        # 合成を始める前に、すべてのクエリのサンプリングレートを確認する
+        for query in queries:
+            if query.outputSamplingRate != sampling_rate:
+                raise HTTPException(status_code=422, detail="サンプリングレートが異なるクエリがあります")
 
-            with zipfile.ZipFile(f, mode="a") as zip_file:
+        def _multi_synthesis() -> bytes:
+            # クエリごとにスレッドを切り替えないよう、zipの作成までをまとめて実行する
+            # 全クエリの音声波形を同時に保持しないよう、1つずつ合成してはzipに書き込む
+            waves = (
+                engine.synthesis(query=query, speaker_id=speaker) for query in queries
+            )
 
-                for i in range(len(queries)):
+            # WAVは圧縮してもほとんど小さくならないため、無圧縮で格納する
+            with io.BytesIO() as f:
 
-                    if queries[i].outputSamplingRate != sampling_rate:
-                        raise HTTPException(
-                            status_code=422, detail="サンプリングレートが異なるクエリがあります"
-                        )
+                with zipfile.ZipFile(
+                    f, mode="w", compression=zipfile.ZIP_STORED
+                ) as zip_file:
 
-                    with TemporaryFile() as wav_file:
+                    # 中間のバイト列を作らず、zipのエントリへ直接書き込む
+                    for i, wave in enumerate(waves):
+                        with zip_file.open(
+                            f"{str(i + 1).zfill(3)}.wav", mode="w"
+                        ) as wav_file:
+                            write_wave(wav_file, wave, sampling_rate)
 
-                        wave = engine.synthesis(query=queries[i], speaker_id=speaker)
-                        soundfile.write(
-                            file=wav_file,
-                            data=wave,
-                            samplerate=sampling_rate,
-                            format="WAV",
-                        )
-                        wav_file.seek(0)
-                        zip_file.writestr(f"{str(i + 1).zfill(3)}.wav", wav_file.read())
+                return f.getvalue()
+
+        zip_bytes = await run_inference(_multi_synthesis)
 
-        return FileResponse(f.name, media_type="application/zip")
+        return Response(content=zip_bytes, media_type="application/zip")
 
     @app.post(
         "/synthesis_morphing",
-        response_class=FileResponse,
+        response_class=Response,
         responses={
             200: {
                 "content": {
@@ -466,7 +691,7 @@ def generate_app(
         tags=["音声合成"],
         summary="2人の話者でモーフィングした音声を合成する",
     )
-    def _synthesis_morphing(
+    async def _synthesis_morphing(
         query: AudioQuery,
         base_speaker: int,
         target_speaker: int,
@@ -479,29 +704,26 @@ def generate_app(
         """
         engine = get_engine(core_version)
 
-        # 生成したパラメータはキャッシュされる
-        morph_param = synthesis_morphing_parameter(
-            engine=engine,
-            query=query,
-            base_speaker=base_speaker,
-            target_speaker=target_speaker,
-        )
-
-        morph_wave = synthesis_morphing(
-            morph_param=morph_param,
-            morph_rate=morph_rate,
-            output_stereo=query.outputStereo,
-        )
+        def _morphing() -> bytes:
+            # 生成したパラメータはキャッシュされる
+            morph_param = synthesis_morphing_parameter(
+                engine=engine,
+                query=query,
+                base_speaker=base_speaker,
+                target_speaker=target_speaker,
+            )
 
-        with NamedTemporaryFile(delete=False) as f:
-            soundfile.write(
-                file=f,
-                data=morph_wave,
-                samplerate=morph_param.fs,
-                format="WAV",
+            morph_wave = synthesis_morphing(
+                morph_param=morph_param,
+                morph_rate=morph_rate,
+                output_stereo=query.outputStereo,
             )
 
-        return FileResponse(f.name, media_type="audio/wav")
+            return wave_to_bytes(morph_wave, morph_param.fs)
+
+        wav_bytes = await run_inference(_morphing)
+
+        return Response(content=wav_bytes, media_type="audio/wav")
 
     @app.post(
         "/guided_synthesis",
@@ -514,17 +736,10 @@ def generate_app(
         },
         tags=["音声合成"],
         summary="Audio synthesis guided by external audio and phonemes",
+        openapi_extra=multipart_form_openapi(GuidedSynthesisForm),
     )
-    def guided_synthesis(
-        kana: str = Form(...),  # noqa: B008
-        speaker_id: int = Form(...),  # noqa: B008
-        normalize: bool = Form(...),  # noqa: B008
-        audio_file: UploadFile = File(...),  # noqa: B008
-        stereo: bool = Form(...),  # noqa: B008
-        sample_rate: int = Form(...),  # noqa: B008
-        volume_scale: float = Form(...),  # noqa: B008
-        pitch_scale: float = Form(...),  # noqa: B008
-        speed_scale: float = Form(...),  # noqa: B008
+    async def guided_synthesis(
+        request: Request,
         core_version: Optional[str] = None,
     ):
         """
@@ -532,50 +747,55 @@ def generate_app(
         Returns the synthesized audio.
         **This API works in the resolution of frame.**
         """
-        if not args.enable_guided_synthesis:
+        if not enable_guided_synthesis:
             raise HTTPException(
                 status_code=404,
                 detail="実験的機能はデフォルトで無効になっています。使用するには引数を指定してください。",
             )
         engine = get_engine(core_version)
+        form = await read_form(request, GuidedSynthesisForm)
         try:
-            accent_phrases = parse_kana(kana)
+            accent_phrases = parse_kana(form.kana)
             query = AudioQuery(
                 accent_phrases=accent_phrases,
-                speedScale=speed_scale,
-                pitchScale=pitch_scale,
+                speedScale=form.speed_scale,
+                pitchScale=form.pitch_scale,
                 intonationScale=1,
-                volumeScale=volume_scale,
+                volumeScale=form.volume_scale,
                 prePhonemeLength=0.1,
                 postPhonemeLength=0.1,
-                outputSamplingRate=sample_rate,
-                outputStereo=stereo,
-                kana=kana,
+                outputSamplingRate=form.sample_rate,
+                outputStereo=form.stereo,
+                kana=form.kana,
             )
-            wave = engine.guided_synthesis(
-                audio_file=audio_file.file,
-                query=query,
-                speaker=speaker_id,
-                normalize=normalize,
+            wave = await run_inference(
+                partial(
+                    engine.guided_synthesis,
+                    audio_file=io.BytesIO(form.audio_file),
+                    query=query,
+                    speaker=form.speaker_id,
+                    normalize=form.normalize,
+                )
             )
 
-            with NamedTemporaryFile(delete=False) as f:
-                soundfile.write(file=f, data=wave, samplerate=sample_rate, format="WAV")
+            wav_bytes = await anyio.to_thread.run_sync(
+                wave_to_bytes, wave, form.sample_rate
+            )
 
-            return FileResponse(f.name, media_type="audio/wav")
+            return Response(content=wav_bytes, media_type="audio/wav")
         except ParseKanaError as err:
             raise HTTPException(
                 status_code=400,
                 detail=ParseKanaBadRequest(err).dict(),
             )
         except StopIteration:
-            print(traceback.format_exc())
+            logger.exception("Failed in Forced Alignment")
             raise HTTPException(
                 status_code=500,
                 detail="Failed in Forced Alignment.",
             )
         except Exception as e:
-            print(traceback.format_exc())
+            logger.exception("Failed in guided synthesis")
             if str(e) == "Decode Failed":
                 raise HTTPException(
                     status_code=500,
@@ -589,7 +809,7 @@ def generate_app(
 
     @app.post(
         "/connect_waves",
-        response_class=FileResponse,
+        response_class=Response,
         responses={
             200: {
                 "content": {
@@ -609,15 +829,10 @@ def generate_app(
         except ConnectBase64WavesException as err:
             return HTTPException(status_code=422, detail=str(err))
 
-        with NamedTemporaryFile(delete=False) as f:
-            soundfile.write(
-                file=f,
-                data=waves_nparray,
-                samplerate=sampling_rate,
-                format="WAV",
-            )
-
-            return FileResponse(f.name, media_type="audio/wav")
+        return Response(
+            content=wave_to_bytes(waves_nparray, sampling_rate),
+            media_type="audio/wav",
+        )
 
     @app.get("/presets", response_model=List[Preset], tags=["その他"])
     def get_presets():
@@ -649,12 +864,59 @@ def generate_app(
     def speakers(
         core_version: Optional[str] = None,
     ):
-        engine = get_engine(core_version)
+        core_version = get_core_version(core_version)
         return Response(
-            content=engine.speakers,
+            content=speakers_bytes[core_version],
             media_type="application/json",
         )
 
+    def read_speaker_info(speaker_uuid: str, style_ids: Tuple[int, ...]) -> bytes:
+        policy = (root_dir / f"speaker_info/{speaker_uuid}/policy.md").read_text(
+            "utf-8"
+        )
+        portrait = b64encode_str(
+            (root_dir / f"speaker_info/{speaker_uuid}/portrait.png").read_bytes()
+        )
+        style_infos = []
+        for id in style_ids:
+            icon = b64encode_str(
+                (root_dir / f"speaker_info/{speaker_uuid}/icons/{id}.png").read_bytes()
+            )
+            voice_samples = [
+                b64encode_str(
+                    (
+                        root_dir
+                        / "speaker_info/{}/voice_samples/{}_{}.wav".format(
+                            speaker_uuid, id, str(j + 1).zfill(3)
+                        )
+                    ).read_bytes()
+                )
+                for j in range(3)
+            ]
+            style_infos.append({"id": id, "icon": icon, "voice_samples": voice_samples})
+
+        ret_data = {"policy": policy, "portrait": portrait, "style_infos": style_infos}
+        return orjson.dumps(ret_data)
+
+    # 話者の追加情報は起動中に変化しないため、起動時にすべて読み込んでおく
+    speaker_info_bytes: Dict[str, Dict[str, bytes]] = {}
+
+    @app.on_event("startup")
+    def preload_speaker_info():
+        # コアのバージョン間で同じ話者・スタイルの場合は、読み込んだものを使い回す
+        loaded: Dict[Tuple[str, Tuple[int, ...]], bytes] = {}
+        for core_version, speakers in speakers_by_uuid.items():
+            speaker_info_bytes[core_version] = {}
+            for speaker_uuid, speaker in speakers.items():
+                key = (speaker_uuid, tuple(style["id"] for style in speaker["styles"]))
+                if key not in loaded:
+                    try:
+                        loaded[key] = read_speaker_info(*key)
+                    except FileNotFoundError:
+                        # 見つからなかった話者はリクエスト時に改めて読み込む
+                        continue
+                speaker_info_bytes[core_version][speaker_uuid] = loaded[key]
+
     @app.get("/speaker_info", response_model=SpeakerInfo, tags=["その他"])
     def speaker_info(speaker_uuid: str, core_version: Optional[str] = None):
         """
@@ -665,51 +927,26 @@ def generate_app(
         -------
         ret_data: SpeakerInfo
         """
-        speakers = json.loads(get_engine(core_version).speakers)
-        for i in range(len(speakers)):
-            if speakers[i]["speaker_uuid"] == speaker_uuid:
-                speaker = speakers[i]
-                break
-        else:
+        core_version = get_core_version(core_version)
+        speaker = speakers_by_uuid[core_version].get(speaker_uuid)
+        if speaker is None:
             raise HTTPException(status_code=404, detail="該当する話者が見つかりません")
 
-        try:
-            policy = (root_dir / f"speaker_info/{speaker_uuid}/policy.md").read_text(
-                "utf-8"
-            )
-            portrait = b64encode_str(
-                (root_dir / f"speaker_info/{speaker_uuid}/portrait.png").read_bytes()
-            )
-            style_infos = []
-            for style in speaker["styles"]:
-                id = style["id"]
-                icon = b64encode_str(
-                    (
-                        root_dir / f"speaker_info/{speaker_uuid}/icons/{id}.png"
-                    ).read_bytes()
-                )
-                voice_samples = [
-                    b64encode_str(
-                        (
-                            root_dir
-                            / "speaker_info/{}/voice_samples/{}_{}.wav".format(
-                                speaker_uuid, id, str(j + 1).zfill(3)
-                            )
-                        ).read_bytes()
-                    )
-                    for j in range(3)
-                ]
-                style_infos.append(
-                    {"id": id, "icon": icon, "voice_samples": voice_samples}
+        content = speaker_info_bytes[core_version].get(speaker_uuid)
+        if content is None:
+            try:
+                content = read_speaker_info(
+                    speaker_uuid, tuple(style["id"] for style in speaker["styles"])
                 )
-        except FileNotFoundError:
-            import traceback
-
-            traceback.print_exc()
-            raise HTTPException(status_code=500, detail="追加情報が見つかりませんでした")
+            except FileNotFoundError:
+                logger.exception("追加情報が見つかりませんでした")
+                raise HTTPException(status_code=500, detail="追加情報が見つかりませんでした")
+            speaker_info_bytes[core_version][speaker_uuid] = content
 
-        ret_data = {"policy": policy, "portrait": portrait, "style_infos": style_infos}
-        return ret_data
+        return Response(
+            content=content,
+            media_type="application/json",
+        )
 
     @app.get("/user_dict", response_model=Dict[str, UserDictWord], tags=["ユーザー辞書"])
     def get_user_dict_words():
@@ -725,7 +962,7 @@ def generate_app(
         try:
             return read_dict()
         except Exception:
-            traceback.print_exc()
+            logger.exception("辞書の読み込みに失敗しました。")
             raise HTTPException(status_code=422, detail="辞書の読み込みに失敗しました。")
 
     @app.post("/user_dict_word", response_model=str, tags=["ユーザー辞書"])
@@ -766,7 +1003,7 @@ def generate_app(
         except ValidationError as e:
             raise HTTPException(status_code=422, detail="パラメータに誤りがあります。\n" + str(e))
         except Exception:
-            traceback.print_exc()
+            logger.exception("ユーザ辞書への追加に失敗しました。")
             raise HTTPException(status_code=422, detail="ユーザ辞書への追加に失敗しました。")
 
     @app.put("/user_dict_word/{word_uuid}", status_code=204, tags=["ユーザー辞書"])
@@ -813,7 +1050,7 @@ def generate_app(
         except ValidationError as e:
             raise HTTPException(status_code=422, detail="パラメータに誤りがあります。\n" + str(e))
         except Exception:
-            traceback.print_exc()
+            logger.exception("ユーザ辞書の更新に失敗しました。")
             raise HTTPException(status_code=422, detail="ユーザ辞書の更新に失敗しました。")
 
     @app.delete("/user_dict_word/{word_uuid}", status_code=204, tags=["ユーザー辞書"])
@@ -832,7 +1069,7 @@ def generate_app(
         except HTTPException:
             raise
         except Exception:
-            traceback.print_exc()
+            logger.exception("ユーザ辞書の更新に失敗しました。")
             raise HTTPException(status_code=422, detail="ユーザ辞書の更新に失敗しました。")
 
     @app.post("/import_user_dict", status_code=204, tags=["ユーザー辞書"])
@@ -853,7 +1090,7 @@ def generate_app(
             import_user_dict(dict_data=import_dict_data, override=override)
             return Response(status_code=204)
         except Exception:
-            traceback.print_exc()
+            logger.exception("ユーザー辞書のインポートに失敗しました。")
             raise HTTPException(status_code=422, detail="ユーザー辞書のインポートに失敗しました。")
 
     @app.get("/supported_devices", response_model=SupportedDevicesInfo, tags=["その他"])
@@ -871,8 +1108,7 @@ def generate_app(
     return app
 
 
-if __name__ == "__main__":
-    multiprocessing.freeze_support()
+def make_argument_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("--host", type=str, default="127.0.0.1")
     parser.add_argument("--port", type=int, default=50021)
@@ -884,6 +1120,10 @@ if __name__ == "__main__":
     parser.add_argument("--enable_cancellable_synthesis", action="store_true")
     parser.add_argument("--enable_guided_synthesis", action="store_true")
     parser.add_argument("--init_processes", type=int, default=2)
+    # HTTPサーバのワーカープロセス数
+    # ワーカーごとに音声合成エンジンを読み込むため、cpu_num_threadsはワーカー数で分割される
+    # --enable_cancellable_synthesisのサブプロセスもワーカーごとに起動される
+    parser.add_argument("--workers", type=int, default=1)
 
     # 引数へcpu_num_threadsの指定がなければ、環境変数をロールします。
     # 環境変数にもない場合は、Noneのままとします。
@@ -892,7 +1132,17 @@ if __name__ == "__main__":
         "--cpu_num_threads", type=int, default=os.getenv("VV_CPU_NUM_THREADS") or None
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def create_app(args: argparse.Namespace) -> FastAPI:
+    """
+    引数をもとに音声合成エンジンを読み込み、アプリケーションを生成する
+    ワーカープロセスを使う場合は、ワーカーごとにこの関数が呼ばれる
+    """
+    # ワーカー全体でCPUスレッドを使いすぎないよう、ワーカー数で分割する
+    if args.cpu_num_threads and args.workers > 1:
+        args.cpu_num_threads = max(args.cpu_num_threads // args.workers, 1)
 
     cpu_num_threads: Optional[int] = args.cpu_num_threads
 
@@ -905,14 +1155,51 @@ if __name__ == "__main__":
         enable_mock=args.enable_mock,
     )
     assert len(synthesis_engines) != 0, "音声合成エンジンがありません。"
-    latest_core_version = str(max([LooseVersion(ver) for ver in synthesis_engines]))
+    latest_core_version = max(synthesis_engines.keys(), key=Version)
 
     cancellable_engine = None
     if args.enable_cancellable_synthesis:
         cancellable_engine = CancellableEngine(args)
 
-    uvicorn.run(
-        generate_app(synthesis_engines, latest_core_version),
-        host=args.host,
-        port=args.port,
+    return generate_app(
+        synthesis_engines,
+        latest_core_version,
+        cpu_num_threads=cpu_num_threads,
+        enable_guided_synthesis=args.enable_guided_synthesis,
+        cancellable_engine=cancellable_engine,
+    )
+
+
+# ワーカープロセスにはエンジン起動時の引数を環境変数で渡す
+ENGINE_ARGV_ENV_NAME = "VV_ENGINE_ARGV"
+
+
+def app_factory() -> FastAPI:
+    """
+    uvicornのワーカープロセスから呼ばれ、アプリケーションを生成する
+    音声合成エンジンはワーカープロセスの中で読み込まれる
+    """
+    args = make_argument_parser().parse_args(
+        json.loads(os.environ[ENGINE_ARGV_ENV_NAME])
     )
+    return create_app(args)
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+
+    args = make_argument_parser().parse_args()
+
+    if args.workers > 1:
+        os.environ[ENGINE_ARGV_ENV_NAME] = json.dumps(sys.argv[1:])
+        # Nuitkaでビルドした場合などはrunという名前のモジュールが存在しないため、
+        # ワーカープロセスでも起動時のスクリプトとして読み込まれる__main__から参照する
+        uvicorn.run(
+            "__main__:app_factory",
+            factory=True,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+        )
+    else:
+        uvicorn.run(create_app(args), host=args.host, port=args.port)
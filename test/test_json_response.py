@@ -0,0 +1,49 @@
+from typing import List
+from unittest import TestCase
+
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from voicevox_engine.model import AccentPhrase, Mora
+from voicevox_engine.utility import NumpyORJSONResponse
+
+
+def make_accent_phrase(pitch: float) -> AccentPhrase:
+    return AccentPhrase(
+        moras=[
+            Mora(
+                text="ア",
+                consonant=None,
+                consonant_length=None,
+                vowel="a",
+                vowel_length=np.float32(0.1),
+                pitch=pitch,
+            )
+        ],
+        accent=1,
+        pause_mora=None,
+    )
+
+
+class TestNumpyORJSONResponse(TestCase):
+    def test_numpy_values(self):
+        response = NumpyORJSONResponse(
+            {"float64": np.float64(0.5), "float32": np.float32(0.25), "array": [1, 2]}
+        )
+        self.assertEqual(response.body, b'{"float64":0.5,"float32":0.25,"array":[1,2]}')
+
+    def test_response_model(self):
+        # np.float64はfloatのサブクラスのため、モデルの検証を経てもそのまま残る
+        accent_phrase = make_accent_phrase(np.average(np.array([5.0, 6.0])))
+        self.assertIs(type(accent_phrase.moras[0].pitch), np.float64)
+
+        app = FastAPI(default_response_class=NumpyORJSONResponse)
+
+        @app.get("/accent_phrases", response_model=List[AccentPhrase])
+        def accent_phrases():
+            return [accent_phrase]
+
+        response = TestClient(app).get("/accent_phrases")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]["moras"][0]["pitch"], 5.5)
@@ -0,0 +1,82 @@
+import asyncio
+from typing import List
+from unittest import TestCase
+
+from starlette.requests import Request
+
+from voicevox_engine.utility import MultipartFormSizeException, read_multipart_form
+
+BOUNDARY = "testboundary"
+
+
+def make_request(content_type: str, chunks: List[bytes]) -> Request:
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks
+    ]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+
+    async def receive():
+        return messages.pop(0)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(b"content-type", content_type.encode("utf-8"))],
+    }
+    return Request(scope, receive)
+
+
+def make_body() -> bytes:
+    return (
+        (
+            f"--{BOUNDARY}\r\n"
+            'Content-Disposition: form-data; name="text"\r\n'
+            "\r\n"
+            "こんにちは\r\n"
+            f"--{BOUNDARY}\r\n"
+            'Content-Disposition: form-data; name="audio_file"; filename="a.wav"\r\n'
+            "Content-Type: audio/wav\r\n"
+            "\r\n"
+        ).encode("utf-8")
+        + (b"\x00\x01\r\x02" * 100)
+        + f"\r\n--{BOUNDARY}--\r\n".encode("utf-8")
+    )
+
+
+class TestReadMultipartForm(TestCase):
+    def test_read_multipart_form(self):
+        body = make_body()
+        # 受信の途中で区切られても解析できることを確認する
+        chunks = [body[i : i + 7] for i in range(0, len(body), 7)]
+        request = make_request(f"multipart/form-data; boundary={BOUNDARY}", chunks)
+        form = asyncio.run(
+            read_multipart_form(request, ["text", "audio_file", "speaker"])
+        )
+        self.assertEqual(
+            form,
+            {
+                "text": "こんにちは".encode("utf-8"),
+                "audio_file": b"\x00\x01\r\x02" * 100,
+            },
+        )
+
+    def test_max_size(self):
+        body = make_body()
+        request = make_request(f"multipart/form-data; boundary={BOUNDARY}", [body])
+        form = asyncio.run(
+            read_multipart_form(request, ["text", "audio_file"], max_size=400)
+        )
+        self.assertEqual(len(form["audio_file"]), 400)
+
+        # 受信の途中で制限を超えた時点で打ち切られることを確認する
+        chunks = [body[i : i + 7] for i in range(0, len(body), 7)]
+        request = make_request(f"multipart/form-data; boundary={BOUNDARY}", chunks)
+        with self.assertRaises(MultipartFormSizeException):
+            asyncio.run(
+                read_multipart_form(request, ["text", "audio_file"], max_size=399)
+            )
+
+    def test_not_multipart(self):
+        request = make_request("application/x-www-form-urlencoded", [b"text=a"])
+        form = asyncio.run(read_multipart_form(request, ["text"]))
+        self.assertEqual(form, {})
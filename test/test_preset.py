@@ -12,6 +12,14 @@ class TestPresetLoader(TestCase):
         self.assertFalse(presets is None)
         self.assertEqual(err_detail, "")
 
+    def test_presets_by_id(self):
+        preset_loader = PresetLoader(preset_path=Path("test/presets-test-1.yaml"))
+        presets, err_detail = preset_loader.load_presets()
+        self.assertEqual(err_detail, "")
+        self.assertEqual(
+            preset_loader.presets_by_id, {preset.id: preset for preset in presets}
+        )
+
     def test_validation_2(self):
         preset_loader = PresetLoader(preset_path=Path("test/presets-test-2.yaml"))
         presets, err_detail = preset_loader.load_presets()
@@ -1,4 +1,5 @@
 import json
+import shutil
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Dict
@@ -7,6 +8,7 @@ from unittest import TestCase
 from fastapi import HTTPException
 from pyopenjtalk import unset_user_dict
 
+from voicevox_engine import user_dict
 from voicevox_engine.model import UserDictWord
 from voicevox_engine.part_of_speech_data import MAX_PRIORITY, part_of_speech_data
 from voicevox_engine.user_dict import (
@@ -16,6 +18,8 @@ from voicevox_engine.user_dict import (
     import_user_dict,
     read_dict,
     rewrite_word,
+    sync_user_dict,
+    user_dict_state,
 )
 
 valid_dict_dict = {
@@ -275,3 +279,27 @@ class TestUserDict(TestCase):
             read_dict(user_dict_path)["aab7dda2-0d97-43c8-8cb7-3f440dab9b4e"],
             import_word,
         )
+
+    def test_sync_user_dict(self):
+        user_dict_path = self.tmp_dir_path / "test_sync_user_dict.json"
+        compiled_dict_path = self.tmp_dir_path / "test_sync_user_dict.dic"
+        apply_word(
+            surface="test",
+            pronunciation="テスト",
+            accent_type=1,
+            user_dict_path=user_dict_path,
+            compiled_dict_path=compiled_dict_path,
+        )
+        state = user_dict_state(compiled_dict_path)
+        self.assertEqual(user_dict._loaded_dict_state, state)
+
+        # 他のプロセスが辞書を置き換えた状況を再現する
+        other_dict_path = self.tmp_dir_path / "other.dic"
+        shutil.copy(compiled_dict_path, other_dict_path)
+        other_dict_path.replace(compiled_dict_path)
+        self.assertNotEqual(user_dict_state(compiled_dict_path), state)
+
+        sync_user_dict(compiled_dict_path)
+        self.assertEqual(
+            user_dict._loaded_dict_state, user_dict_state(compiled_dict_path)
+        )
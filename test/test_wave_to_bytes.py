@@ -0,0 +1,76 @@
+import io
+from unittest import TestCase
+
+import numpy as np
+import soundfile
+
+from voicevox_engine.utility import wave_to_bytes, write_wave
+
+
+class TestWaveToBytes(TestCase):
+    def test_mono(self):
+        wave = np.linspace(-0.5, 0.5, 2400, dtype=np.float32)
+        data, sampling_rate = soundfile.read(io.BytesIO(wave_to_bytes(wave, 24000)))
+        self.assertEqual(sampling_rate, 24000)
+        self.assertEqual(data.shape, wave.shape)
+        np.testing.assert_allclose(data, wave, atol=1e-4)
+
+    def test_stereo(self):
+        wave = np.linspace(-0.5, 0.5, 2400, dtype=np.float32)
+        wave = np.array([wave, wave]).T
+        data, sampling_rate = soundfile.read(io.BytesIO(wave_to_bytes(wave, 48000)))
+        self.assertEqual(sampling_rate, 48000)
+        self.assertEqual(data.shape, wave.shape)
+        np.testing.assert_allclose(data, wave, atol=1e-4)
+
+    def test_clip(self):
+        wave = np.array([-2.0, -1.0, 0.0, 1.0, 2.0])
+        data, _ = soundfile.read(io.BytesIO(wave_to_bytes(wave, 24000)), dtype="int16")
+        np.testing.assert_array_equal(data, [-32768, -32768, 0, 32767, 32767])
+        # 元の波形は書き換えない
+        np.testing.assert_array_equal(wave, [-2.0, -1.0, 0.0, 1.0, 2.0])
+
+    def test_same_as_soundfile(self):
+        # 16bit整数への変換をsoundfileに任せた場合と同じ値になることを確認する
+        rng = np.random.default_rng(0)
+        for wave in [
+            rng.uniform(-1.2, 1.2, 24000).astype(np.float32),
+            rng.uniform(-1.2, 1.2, 24000),
+            np.arange(-24, 24) / 65536,
+            rng.integers(-(2**31), 2**31, 24000, dtype=np.int32),
+        ]:
+            with io.BytesIO() as f:
+                soundfile.write(f, wave, 24000, format="WAV", subtype="PCM_16")
+                expected = f.getvalue()
+            self.assertEqual(wave_to_bytes(wave, 24000), expected)
+
+    def test_int16(self):
+        wave = np.array([-32768, -1, 0, 1, 32767], dtype=np.int16)
+        data, _ = soundfile.read(io.BytesIO(wave_to_bytes(wave, 24000)), dtype="int16")
+        np.testing.assert_array_equal(data, wave)
+
+
+class UnseekableWriter(io.RawIOBase):
+    def __init__(self):
+        super().__init__()
+        self.buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.buffer.extend(b)
+        return len(b)
+
+
+class TestWriteWave(TestCase):
+    def test_unseekable(self):
+        wave = np.linspace(-0.5, 0.5, 2400, dtype=np.float32)
+        wave = np.array([wave, wave]).T
+        f = UnseekableWriter()
+        write_wave(f, wave, 24000)
+
+        data, sampling_rate = soundfile.read(io.BytesIO(bytes(f.buffer)))
+        self.assertEqual(sampling_rate, 24000)
+        self.assertEqual(data.shape, wave.shape)
+        np.testing.assert_allclose(data, wave, atol=1e-4)
@@ -1,19 +1,17 @@
 import argparse
 import asyncio
 import queue
-from distutils.version import LooseVersion
 from multiprocessing import Pipe, Process
 from multiprocessing.connection import Connection
-from tempfile import NamedTemporaryFile
 from typing import List, Optional, Tuple
 
-import soundfile
-
 # FIXME: remove FastAPI dependency
 from fastapi import HTTPException, Request
+from packaging.version import Version
 
 from .model import AudioQuery, Speaker
 from .synthesis_engine import make_synthesis_engines
+from .utility import wave_to_bytes
 
 
 class CancellableEngine:
@@ -118,11 +116,11 @@ class CancellableEngine:
         speaker_id: Speaker,
         request: Request,
         core_version: Optional[str],
-    ) -> str:
+    ) -> bytes:
         """
         音声合成を行う関数
         通常エンジンの引数に比べ、requestが必要になっている
-        また、返り値がファイル名になっている
+        また、返り値がWAVファイルのバイト列になっている
 
         Parameters
         ----------
@@ -135,14 +133,15 @@ class CancellableEngine:
 
         Returns
         -------
-        f_name: str
-            生成された音声ファイルの名前
+        wav_bytes: bytes
+            生成された音声ファイルのバイト列
+            バージョンが見つからなかった場合は空のバイト列
         """
         proc, sub_proc_con1 = self.procs_and_cons.get()
         self.watch_con_list.append((request, proc))
         try:
             sub_proc_con1.send((query, speaker_id, core_version))
-            f_name = sub_proc_con1.recv()
+            wav_bytes = sub_proc_con1.recv()
         except EOFError:
             raise HTTPException(status_code=422, detail="既にサブプロセスは終了されています")
         except Exception:
@@ -150,7 +149,7 @@ class CancellableEngine:
             raise
 
         self.finalize_con(request, proc, sub_proc_con1)
-        return f_name
+        return wav_bytes
 
     async def catch_disconnection(self):
         """
@@ -197,7 +196,7 @@ def start_synthesis_subprocess(
         enable_mock=args.enable_mock,
     )
     assert len(synthesis_engines) != 0, "音声合成エンジンがありません。"
-    latest_core_version = str(max([LooseVersion(ver) for ver in synthesis_engines]))
+    latest_core_version = max(synthesis_engines.keys(), key=Version)
     while True:
         try:
             query, speaker_id, core_version = sub_proc_con.recv()
@@ -207,14 +206,10 @@ def start_synthesis_subprocess(
                 _engine = synthesis_engines[core_version]
             else:
                 # バージョンが見つからないエラー
-                sub_proc_con.send("")
+                sub_proc_con.send(b"")
                 continue
             wave = _engine._synthesis_impl(query, speaker_id)
-            with NamedTemporaryFile(delete=False) as f:
-                soundfile.write(
-                    file=f, data=wave, samplerate=query.outputSamplingRate, format="WAV"
-                )
-            sub_proc_con.send(f.name)
+            sub_proc_con.send(wave_to_bytes(wave, query.outputSamplingRate))
         except Exception:
             sub_proc_con.close()
             raise
@@ -311,3 +311,31 @@ class EngineManifest(BaseModel):
     terms_of_service: str = Field(title="エンジンの利用規約")
     update_infos: List[UpdateInfo] = Field(title="エンジンのアップデート情報")
     dependency_licenses: List[LicenseInfo] = Field(title="依存関係のライセンス情報")
+
+
+class GuidedAccentPhraseForm(BaseModel):
+    """
+    外部の音声からアクセント句を得るためのフォーム
+    """
+
+    text: str = Field(title="テキストまたは読み仮名")
+    speaker: int = Field(title="話者ID")
+    is_kana: bool = Field(title="テキストを読み仮名として扱うかどうか")
+    audio_file: bytes = Field(title="ガイドとなる音声ファイル")
+    normalize: bool = Field(title="音高を話者に合わせて正規化するかどうか")
+
+
+class GuidedSynthesisForm(BaseModel):
+    """
+    外部の音声をガイドにして音声合成するためのフォーム
+    """
+
+    kana: str = Field(title="読み仮名")
+    speaker_id: int = Field(title="話者ID")
+    normalize: bool = Field(title="音高を話者に合わせて正規化するかどうか")
+    audio_file: bytes = Field(title="ガイドとなる音声ファイル")
+    stereo: bool = Field(title="音声データをステレオ出力するか否か")
+    sample_rate: int = Field(title="音声データの出力サンプリングレート")
+    volume_scale: float = Field(title="全体の音量")
+    pitch_scale: float = Field(title="全体の音高")
+    speed_scale: float = Field(title="全体の話速")
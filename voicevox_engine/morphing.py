@@ -97,10 +97,13 @@ def synthesis_morphing(
     if morph_rate < 0.0 or morph_rate > 1.0:
         raise ValueError("morph_rateは0.0から1.0の範囲で指定してください")
 
-    morph_spectrogram = (
-        morph_param.base_spectrogram * (1.0 - morph_rate)
-        + morph_param.target_spectrogram * morph_rate
+    # スペクトログラムは大きいため、一時配列を作らないようインプレースで混ぜ合わせる
+    # base * (1 - rate) + target * rate = base + (target - base) * rate
+    morph_spectrogram = np.subtract(
+        morph_param.target_spectrogram, morph_param.base_spectrogram
     )
+    morph_spectrogram *= morph_rate
+    morph_spectrogram += morph_param.base_spectrogram
 
     y_h = pw.synthesize(
         morph_param.base_f0,
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Dict
 
 import yaml
 from pydantic import ValidationError
@@ -12,6 +13,7 @@ class PresetLoader:
         preset_path: Path,
     ):
         self.presets = []
+        self.presets_by_id: Dict[int, Preset] = {}
         self.last_modified_time = 0
         self.preset_path = preset_path
 
@@ -55,5 +57,6 @@ class PresetLoader:
             return None, "プリセットのidに重複があります"
 
         self.presets = _presets
+        self.presets_by_id = {preset.id: preset for preset in _presets}
         self.last_modified_time = _last_modified_time
         return self.presets, ""
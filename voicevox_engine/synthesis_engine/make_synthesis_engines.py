@@ -1,4 +1,5 @@
 import json
+import os
 import sys
 import traceback
 from pathlib import Path
@@ -65,6 +66,12 @@ def make_synthesis_engines(
     voicelib_dirs = [p.expanduser() for p in voicelib_dirs]
     runtime_dirs = [p.expanduser() for p in runtime_dirs]
 
+    # ランタイムがOpenMPやMKLのスレッドプールを持つ場合に、指定したスレッド数を超えないようにする
+    # 読み込み時に参照されるため、ランタイムを読み込む前に設定する。明示的な指定があればそちらを優先する
+    if cpu_num_threads > 0:
+        for env_name in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+            os.environ.setdefault(env_name, str(cpu_num_threads))
+
     load_runtime_lib(runtime_dirs)
     synthesis_engines = {}
     for core_dir in voicelib_dirs:
@@ -1,8 +1,9 @@
 import json
 import sys
+import threading
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from uuid import UUID, uuid4
 
 import pyopenjtalk
@@ -24,6 +25,52 @@ default_dict_path = root_dir / "default.csv"
 user_dict_path = save_dir / "user_dict.json"
 compiled_dict_path = save_dir / "user.dic"
 
+# 読み込んだコンパイル済み辞書の状態
+# 複数のプロセスで動かす場合に、他のプロセスによる辞書の更新を検知するために使う
+_loaded_dict_state: Optional[Tuple[int, int, int]] = None
+_loaded_dict_lock = threading.Lock()
+
+
+def user_dict_state(
+    compiled_dict_path: Path = compiled_dict_path,
+) -> Optional[Tuple[int, int, int]]:
+    """
+    コンパイル済みのユーザー辞書のinode番号・更新日時・サイズを返す
+    辞書は置き換えで更新されるため、更新されると値が変わる
+    辞書が存在しない場合はNoneを返す
+    """
+    try:
+        stat = compiled_dict_path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _load_user_dict(compiled_dict_path: Path):
+    global _loaded_dict_state
+    # 読み込みの直前に状態を記録し、読み込み中に更新された場合は次回に読み込み直す
+    _loaded_dict_state = user_dict_state(compiled_dict_path)
+    pyopenjtalk.set_user_dict(str(compiled_dict_path.resolve(strict=True)))
+
+
+def sync_user_dict(compiled_dict_path: Path = compiled_dict_path):
+    """
+    読み込んだ後にユーザー辞書が更新されていた場合、読み込み直す
+    他のプロセスで更新された辞書を、テキストの解析前に反映させるために使う
+    """
+    global _loaded_dict_state
+    if user_dict_state(compiled_dict_path) == _loaded_dict_state:
+        return
+    with _loaded_dict_lock:
+        state = user_dict_state(compiled_dict_path)
+        if state == _loaded_dict_state:
+            return
+        if state is None:
+            pyopenjtalk.unset_user_dict()
+            _loaded_dict_state = None
+        else:
+            _load_user_dict(compiled_dict_path)
+
 
 def write_to_json(user_dict: Dict[str, UserDictWord], user_dict_path: Path):
     user_dict = {word_uuid: word.dict() for word_uuid, word in user_dict.items()}
@@ -37,11 +84,19 @@ def user_dict_startup_processing(
     compiled_dict_path: Path = compiled_dict_path,
 ):
     if not compiled_dict_path.is_file():
+        # 複数のプロセスが同時に起動しても書きかけの辞書を読み込まないよう、
+        # 一時ファイルにコンパイルしてから置き換える
+        with NamedTemporaryFile(
+            dir=compiled_dict_path.parent, suffix=".dic", delete=False
+        ) as f:
+            tmp_dict_path = Path(f.name).resolve()
         pyopenjtalk.create_user_dict(
             str(default_dict_path.resolve(strict=True)),
-            str(compiled_dict_path.resolve()),
+            str(tmp_dict_path),
         )
-    pyopenjtalk.set_user_dict(str(compiled_dict_path.resolve(strict=True)))
+        tmp_dict_path.replace(compiled_dict_path)
+    with _loaded_dict_lock:
+        _load_user_dict(compiled_dict_path)
 
 
 def update_dict(
@@ -91,12 +146,13 @@ def update_dict(
     )
     if not tmp_dict_path.is_file():
         raise RuntimeError("辞書のコンパイル時にエラーが発生しました。")
-    pyopenjtalk.unset_user_dict()
-    try:
-        tmp_dict_path.replace(compiled_dict_path)
-    finally:
-        if compiled_dict_path.is_file():
-            pyopenjtalk.set_user_dict(str(compiled_dict_path.resolve(strict=True)))
+    with _loaded_dict_lock:
+        pyopenjtalk.unset_user_dict()
+        try:
+            tmp_dict_path.replace(compiled_dict_path)
+        finally:
+            if compiled_dict_path.is_file():
+                _load_user_dict(compiled_dict_path)
 
 
 def read_dict(user_dict_path: Path = user_dict_path) -> Dict[str, UserDictWord]:
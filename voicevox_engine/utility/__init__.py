@@ -4,10 +4,18 @@ from .connect_base64_waves import (
     decode_base64_waves,
 )
 from .engine_root import engine_root
+from .json_response import NumpyORJSONResponse
+from .multipart_form import MultipartFormSizeException, read_multipart_form
+from .wave_to_bytes import wave_to_bytes, write_wave
 
 __all__ = [
     "ConnectBase64WavesException",
+    "MultipartFormSizeException",
+    "NumpyORJSONResponse",
     "connect_base64_waves",
     "decode_base64_waves",
     "engine_root",
+    "read_multipart_form",
+    "wave_to_bytes",
+    "write_wave",
 ]
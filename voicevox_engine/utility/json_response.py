@@ -0,0 +1,15 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class NumpyORJSONResponse(ORJSONResponse):
+    """
+    orjsonでJSONに変換するレスポンス
+    エンジンの出力にはnumpyの値が含まれることがあり、
+    np.float64はfloatのサブクラスとしてモデルの検証を通り抜けるため、そのまま変換できるようにする
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
@@ -0,0 +1,78 @@
+from typing import Dict, Iterable, Optional
+
+from starlette.requests import Request
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.parser import ParseFailedException
+from streaming_form_data.targets import ValueTarget
+from streaming_form_data.validators import MaxSizeValidator, ValidationError
+
+
+class MultipartFormSizeException(Exception):
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
+class _FormFieldTarget(ValueTarget):
+    """
+    フィールドが送られてきたかどうかを記録するValueTarget
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        super().__init__(
+            validator=MaxSizeValidator(max_size) if max_size is not None else None
+        )
+        self.received = False
+
+    def on_start(self):
+        self.received = True
+
+
+async def read_multipart_form(
+    request: Request, names: Iterable[str], max_size: Optional[int] = None
+) -> Dict[str, bytes]:
+    """
+    multipart/form-dataのリクエストボディを受信しながら解析し、指定したフィールドの値を得る
+    解析はC拡張で行われるため、python-multipartでの解析より軽い
+    値はメモリ上に保持するため、max_sizeを超えるフィールドが送られてきた時点で受信を打ち切る
+
+    Parameters
+    ----------
+    request: Request
+        リクエスト
+    names: Iterable[str]
+        値を得るフィールド名
+    max_size: Optional[int]
+        1つのフィールドの値の最大バイト数
+        Noneの場合は制限しない
+
+    Returns
+    -------
+    form: Dict[str, bytes]
+        フィールド名と値の辞書
+        送られてこなかったフィールドは含まれない
+        multipart/form-dataとして解析できなかった場合は空になる
+
+    Raises
+    ------
+    MultipartFormSizeException
+        フィールドの値がmax_sizeを超えた場合
+    """
+    try:
+        parser = StreamingFormDataParser(headers=request.headers)
+    except ParseFailedException:
+        return {}
+
+    targets = {name: _FormFieldTarget(max_size) for name in names}
+    for name, target in targets.items():
+        parser.register(name, target)
+
+    try:
+        async for chunk in request.stream():
+            parser.data_received(chunk)
+    except ParseFailedException:
+        return {}
+    except ValidationError:
+        raise MultipartFormSizeException(f"フォームの値は{max_size}バイト以下にしてください")
+
+    return {name: target.value for name, target in targets.items() if target.received}
@@ -0,0 +1,81 @@
+import io
+import wave as wave_module
+from typing import IO
+
+import numpy as np
+import soundfile
+
+
+def _wave_to_pcm16(wave: np.ndarray) -> np.ndarray:
+    """
+    音声波形を16bit整数に変換する
+    soundfileに浮動小数点数や32bit整数の波形を渡して16bit PCMで書き出した場合と同じ値になる
+    16bit整数の音声波形はそのまま返す
+    """
+    if wave.dtype == np.int16:
+        return wave
+    if np.issubdtype(wave.dtype, np.integer):
+        # libsndfileと同様に上位16bitを取り出す
+        shift = wave.dtype.itemsize * 8 - 16
+        if shift >= 0:
+            return (wave >> shift).astype(np.int16)
+        return wave.astype(np.int16) << -shift
+
+    # libsndfileと同様に32bit整数に丸めてから上位16bitを取り出す
+    # 上限は32bit整数の最大値ではなく、float32でも正確に表せて上位16bitが同じ値にする
+    # 元の波形は書き換えず、掛け算の結果の配列の上で変換する
+    pcm = wave * 2147483648.0
+    np.rint(pcm, out=pcm)
+    np.clip(pcm, -2147483648.0, 2147418112.0, out=pcm)
+    return (pcm.astype(np.int32) >> 16).astype(np.int16)
+
+
+def wave_to_bytes(wave: np.ndarray, sampling_rate: int) -> bytes:
+    """
+    音声波形を16bit PCMのWAV形式のバイト列にする
+    一時ファイルを介さず、メモリ上で書き出す
+
+    Parameters
+    ----------
+    wave: np.ndarray
+        音声波形
+    sampling_rate: int
+        サンプリングレート
+
+    Returns
+    -------
+    wav_bytes: bytes
+        WAVファイルのバイト列
+    """
+    with io.BytesIO() as f:
+        soundfile.write(
+            file=f,
+            data=_wave_to_pcm16(wave),
+            samplerate=sampling_rate,
+            format="WAV",
+            subtype="PCM_16",
+        )
+        return f.getvalue()
+
+
+def write_wave(f: IO[bytes], wave: np.ndarray, sampling_rate: int) -> None:
+    """
+    音声波形を16bit PCMのWAV形式でファイルオブジェクトに書き出す
+    ヘッダを先に確定させてシークしないため、zipのエントリのようなシークできない書き込み先にも使える
+
+    Parameters
+    ----------
+    f: IO[bytes]
+        書き込み先のファイルオブジェクト
+    wave: np.ndarray
+        音声波形
+    sampling_rate: int
+        サンプリングレート
+    """
+    pcm = _wave_to_pcm16(wave)
+    with wave_module.open(f, "wb") as wave_writer:
+        wave_writer.setnchannels(1 if pcm.ndim == 1 else pcm.shape[1])
+        wave_writer.setsampwidth(2)
+        wave_writer.setframerate(sampling_rate)
+        wave_writer.setnframes(pcm.shape[0])
+        wave_writer.writeframes(pcm.astype("<i2", copy=False).tobytes())